@@ -1,5 +1,12 @@
 import numpy
 import os
+import shutil
+import tempfile
+
+# Array names stored for each cached dataset, in the order they are
+# returned by load_dataset
+_ARRAY_NAMES = ("X_train", "y_train", "X_test", "y_test")
+
 
 class CachedDatasets:
     """A convenience class to access cached time series datasets.
@@ -40,9 +47,13 @@ class CachedDatasets:
             A list of names of all cached (univariate and multivariate) dataset
             namas.
         """
-        return [fname[:fname.rfind(".")]
-                for fname in os.listdir(self.path)
-                if fname.endswith(".npz")]
+        names = set()
+        for fname in os.listdir(self.path):
+            if fname.endswith(".npz"):
+                names.add(fname[:fname.rfind(".")])
+            elif os.path.isdir(os.path.join(self.path, fname)):
+                names.add(fname)
+        return sorted(names)
 
     def load_dataset(self, dataset_name):
         """Load a cached dataset from its name.
@@ -79,9 +90,43 @@ class CachedDatasets:
         IOError
             If the dataset does not exist or cannot be read.
         """
+        npy_dir = os.path.join(self.path, dataset_name)
+        if not os.path.isdir(npy_dir):
+            self._migrate_npz(dataset_name, npy_dir)
+        if os.path.isdir(npy_dir):
+            # memory-mapped loads are free of any copy or decompression:
+            # the OS pages data in lazily, as it gets accessed
+            return tuple(
+                numpy.load(os.path.join(npy_dir, name + ".npy"),
+                           mmap_mode="r", allow_pickle=False)
+                for name in _ARRAY_NAMES
+            )
         npzfile = numpy.load(os.path.join(self.path, dataset_name + ".npz"))
         X_train = npzfile["X_train"]
         X_test = npzfile["X_test"]
         y_train = npzfile["y_train"]
         y_test = npzfile["y_test"]
         return X_train, y_train, X_test, y_test
+
+    def _migrate_npz(self, dataset_name, npy_dir):
+        """Rewrite a cached ``.npz`` archive as one ``.npy`` file per array
+        so that subsequent loads can be memory-mapped.
+
+        The migration is best-effort: when the cache directory is not
+        writable (e.g. a system-wide install), the dataset simply keeps
+        being served from the ``.npz`` archive.
+        """
+        npz_fname = os.path.join(self.path, dataset_name + ".npz")
+        if not os.path.exists(npz_fname):
+            return
+        tmp_dir = None
+        try:
+            npzfile = numpy.load(npz_fname)
+            tmp_dir = tempfile.mkdtemp(dir=self.path)
+            for name in _ARRAY_NAMES:
+                numpy.save(os.path.join(tmp_dir, name + ".npy"),
+                           npzfile[name])
+            os.rename(tmp_dir, npy_dir)
+        except OSError:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -4,15 +4,206 @@ series datasets.
 """
 
 import zipfile
-import tempfile
 import shutil
 import os
 import warnings
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen, urlretrieve
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
 
 
+def _probe_byte_ranges(url):
+    """Issue a HEAD request and report whether the server supports HTTP
+    byte-range requests for that URL.
+
+    Parameters
+    ----------
+    url : string
+        URL to be probed.
+
+    Returns
+    -------
+    int
+        Size of the resource in bytes (0 if unknown).
+    bool
+        Whether range requests can be used to fetch the resource.
+    """
+    try:
+        with urlopen(Request(url, method="HEAD")) as response:
+            size = int(response.headers.get("Content-Length", 0))
+            accept_ranges = response.headers.get("Accept-Ranges", "none")
+    except Exception:
+        return 0, False
+    return size, (size > 0 and accept_ranges.lower() == "bytes")
+
+
+def _multi_stream_download(url, local_fname, n_streams=4,
+                           chunk_size=1024 * 1024, size=None):
+    """Download a file, splitting the transfer into several HTTP Range
+    requests when the server supports them.
+
+    The target file is pre-sized and each stream writes directly into its
+    own slice, so no post-download concatenation is needed. A plain
+    single-stream download is used when the file size is unknown or the
+    server does not accept range requests. Data is first written under a
+    ``.part`` suffix and moved into place once complete, so an interrupted
+    download never leaves a plausible-looking file behind.
+
+    Parameters
+    ----------
+    url : string
+        URL from which to download.
+    local_fname : str
+        Path of the file to be written.
+    n_streams : int (default: 4)
+        Number of parallel range requests to be issued.
+    chunk_size : int (default: 1MB)
+        Size of the chunks read from each HTTP response.
+    size : int or None (default: None)
+        Size of the resource in bytes for range-capable servers, if
+        already known from a previous probe. If None, the server is probed
+        with a HEAD request first.
+    """
+    part_fname = local_fname + ".part"
+    if size is None:
+        size, supports_ranges = _probe_byte_ranges(url)
+    else:
+        supports_ranges = size > 0
+
+    if not supports_ranges or n_streams <= 1:
+        urlretrieve(url, part_fname)
+        os.replace(part_fname, local_fname)
+        return local_fname
+
+    with open(part_fname, "wb") as f:
+        f.truncate(size)
+
+    def _fetch_range(start, stop):
+        # half-open interval [start, stop), Range header bounds included
+        request = Request(url,
+                          headers={"Range": "bytes=%d-%d" % (start, stop - 1)})
+        with urlopen(request) as response:
+            if response.status != 206:
+                # the server ignored the Range header and is sending the
+                # full body; writing it at this stream's offset would
+                # corrupt the file, so do not write anything
+                return False
+            with open(part_fname, "r+b") as f:
+                f.seek(start)
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+        return True
+
+    stream_size = -(-size // n_streams)  # ceiling division
+    with ThreadPoolExecutor(max_workers=n_streams) as executor:
+        futures = [
+            executor.submit(_fetch_range, start,
+                            min(start + stream_size, size))
+            for start in range(0, size, stream_size)
+        ]
+        results = [future.result() for future in futures]
+    if not all(results):
+        # some server (or intermediate proxy) advertised byte ranges but
+        # did not honor them: fall back to a single-stream download
+        urlretrieve(url, part_fname)
+    os.replace(part_fname, local_fname)
+    return local_fname
+
+
+def _extract_zip_member(zip_file, member, target_dir,
+                        buffer_size=1024 * 1024):
+    """Extract a single zip member below target_dir using a large copy
+    buffer.
+
+    ``ZipFile.extractall`` copies each member with a small default buffer,
+    which makes extraction syscall-bound on archives made of many files.
+    Streaming through :func:`shutil.copyfileobj` with a 1MB buffer keeps
+    the number of read/write calls low.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        Open zip archive the member is read from.
+    member : zipfile.ZipInfo
+        Member to be extracted.
+    target_dir : str
+        Directory below which the member is written.
+    buffer_size : int (default: 1MB)
+        Size of the copy buffer.
+    """
+    target_dir = os.path.abspath(target_dir)
+    out_path = os.path.normpath(os.path.join(target_dir, member.filename))
+    if os.path.commonpath([out_path, target_dir]) != target_dir:
+        # member path would escape target_dir (e.g. through ".."
+        # components or a sibling directory sharing its name as a
+        # prefix), do not extract it
+        warnings.warn("Skipping zip member %s: its path escapes the "
+                      "extraction directory" % member.filename,
+                      category=RuntimeWarning)
+        return
+    if member.is_dir():
+        os.makedirs(out_path, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with zip_file.open(member) as src, open(out_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=buffer_size)
+
+
+def _extract_zip(local_zip_fname, target_dir, min_members_parallel=8):
+    """Extract a whole zip archive, decompressing members in parallel when
+    the archive holds enough files to amortize the thread pool.
+
+    DEFLATE decompression of distinct members is independent and
+    CPU-bound, but a ``ZipFile`` handle cannot be shared across concurrent
+    member reads, so each worker thread opens its own handle and processes
+    its own slice of the member list. Archives with few members are
+    extracted sequentially.
+
+    Parameters
+    ----------
+    local_zip_fname : str or file-like
+        Path to the zip archive, or a readable seekable file object.
+        Parallel extraction requires per-thread handles and is therefore
+        only available for path inputs; file objects are extracted
+        sequentially.
+    target_dir : str
+        Directory below which members are written.
+    min_members_parallel : int (default: 8)
+        Member count above which extraction goes through a thread pool.
+    """
+    with zipfile.ZipFile(local_zip_fname, "r") as f:
+        members = f.infolist()
+        if (len(members) <= min_members_parallel or
+                not isinstance(local_zip_fname, str)):
+            for member in members:
+                _extract_zip_member(f, member, target_dir)
+            return
+        # create directories up front so that workers do not race on them
+        for member in members:
+            if member.is_dir():
+                _extract_zip_member(f, member, target_dir)
+
+    file_members = [member for member in members if not member.is_dir()]
+
+    def _extract_slice(members_slice):
+        with zipfile.ZipFile(local_zip_fname, "r") as zip_file:
+            for member in members_slice:
+                _extract_zip_member(zip_file, member, target_dir)
+
+    n_workers = min(os.cpu_count() or 1, len(file_members))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(_extract_slice, file_members[i::n_workers])
+            for i in range(n_workers)
+        ]
+        for future in futures:
+            future.result()
+
+
 def extract_from_zip_url(url, target_dir=None, verbose=False):
     """Download a zip file from its URL and unzip it.
 
@@ -34,30 +225,51 @@ def extract_from_zip_url(url, target_dir=None, verbose=False):
         successful, None otherwise
     """
     fname = os.path.basename(url)
-    tmpdir = tempfile.mkdtemp()
-    local_zip_fname = os.path.join(tmpdir, fname)
-    urlretrieve(url, local_zip_fname)
+    # The zip is kept in a cache directory next to target_dir (so that
+    # callers clearing target_dir before a retry do not wipe it) and is
+    # only deleted once extraction succeeded: a failure between download
+    # and extraction does not force a full re-download on the next try.
+    cache_zip_dir = os.path.join(
+        os.path.dirname(os.path.abspath(target_dir)), ".zips"
+    )
+    os.makedirs(cache_zip_dir, exist_ok=True)
+    local_zip_fname = os.path.join(cache_zip_dir, fname)
+
+    size, supports_ranges = _probe_byte_ranges(url)
+    if (os.path.exists(local_zip_fname) and size > 0 and
+            os.path.getsize(local_zip_fname) == size):
+        if verbose:
+            print("Reusing previously downloaded file %s" % local_zip_fname)
+    elif supports_ranges:
+        _multi_stream_download(url, local_zip_fname, size=size)
+    else:
+        part_fname = local_zip_fname + ".part"
+        with urlopen(url) as response, open(part_fname, "wb") as f:
+            shutil.copyfileobj(response, f, length=1024 * 1024)
+        os.replace(part_fname, local_zip_fname)
+
     os.makedirs(target_dir, exist_ok=True)
     try:
-        with zipfile.ZipFile(local_zip_fname, "r") as f:
-            f.extractall(path=target_dir)
+        _extract_zip(local_zip_fname, target_dir)
         if verbose:
             print("Successfully extracted file %s to path %s" %
                   (local_zip_fname, target_dir))
+        os.remove(local_zip_fname)
         return target_dir
     except zipfile.BadZipFile:
+        # a corrupted zip would fail again on the next try, do not keep it
+        os.remove(local_zip_fname)
         warnings.warn("Corrupted or missing zip file encountered, aborting",
                       category=RuntimeWarning)
         return None
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 def in_file_string_replace(filename, old_string, new_string):
     """String replacement within a text file. It is used to fix typos in
     downloaded csv file.
 
-    The code was modified from "https://stackoverflow.com/questions/4128144/"
+    The file is only rewritten when a replacement actually took place, so
+    applying the same fix twice leaves an already-correct file untouched.
 
     Parameters
     ----------
@@ -68,9 +280,10 @@ def in_file_string_replace(filename, old_string, new_string):
     new_string : str
         The new string that will replace old_string
     """
-    with open(filename) as f:
-        s = f.read()
+    with open(filename, 'rb') as f:
+        data = f.read()
 
-    with open(filename, 'w') as f:
-        s = s.replace(old_string, new_string)
-        f.write(s)
+    new_data = data.replace(old_string.encode(), new_string.encode())
+    if new_data != data:
+        with open(filename, 'wb') as f:
+            f.write(new_data)
@@ -1,12 +1,19 @@
 import os
+import time
 import warnings
 import csv
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.request import urlretrieve
 
 from tslearn.utils import _load_arff_uea, _load_txt_uea
 from .datasets import in_file_string_replace, extract_from_zip_url
 
+# How long (in seconds) the summary CSV files downloaded from
+# timeseriesclassification.com are considered fresh enough not to be
+# re-downloaded on instantiation
+_INDEX_FILES_TTL = 24 * 60 * 60
+
 
 class UCR_UEA_datasets:
     """A convenience class to access UCR/UEA time series datasets.
@@ -26,6 +33,13 @@ class UCR_UEA_datasets:
         Datasets are always cached upon loading, and this parameter only
         determines whether the cached version shall be refreshed upon loading.
 
+    force_refresh : bool (default: False)
+        Whether the summary CSV files downloaded from the UCR/UEA website
+        should be re-downloaded upon construction even if a fresh enough
+        cached copy is available. By default, cached copies are reused for
+        a day before being refreshed, and stale copies are kept when the
+        website cannot be reached, which allows offline use.
+
     Notes
     -----
         Downloading dataset files can be time-consuming, it is recommended
@@ -42,35 +56,36 @@ class UCR_UEA_datasets:
     .. [1] A. Bagnall, J. Lines, W. Vickers and E. Keogh, The UEA & UCR Time
        Series Classification Repository, www.timeseriesclassification.com
     """
-    def __init__(self, use_cache=True):
+    def __init__(self, use_cache=True, force_refresh=False):
         self.use_cache = use_cache
         self._data_dir = os.path.expanduser(os.path.join(
             "~", ".tslearn", "datasets", "UCR_UEA"
         ))
         os.makedirs(self._data_dir, exist_ok=True)
 
+        url_multivariate = ("https://www.timeseriesclassification.com/"
+                            "Downloads/Archives/summaryMultivariate.csv")
+        self._list_multivariate_filename = os.path.join(
+            self._data_dir, os.path.basename(url_multivariate)
+        )
+        url_baseline = ("https://www.timeseriesclassification.com/"
+                        "singleTrainTest.csv")
+        self._baseline_scores_filename = os.path.join(
+            self._data_dir, os.path.basename(url_baseline))
         try:
-            url_multivariate = ("https://www.timeseriesclassification.com/"
-                                "Downloads/Archives/summaryMultivariate.csv")
-            self._list_multivariate_filename = os.path.join(
-                self._data_dir, os.path.basename(url_multivariate)
-            )
-            urlretrieve(url_multivariate, self._list_multivariate_filename)
-            url_baseline = ("https://www.timeseriesclassification.com/"
-                            "singleTrainTest.csv")
-            self._baseline_scores_filename = os.path.join(
-                self._data_dir, os.path.basename(url_baseline))
-            urlretrieve(url_baseline, self._baseline_scores_filename)
-
-            # fix typos in that CSV to match with the name in the download link
-            in_file_string_replace(self._baseline_scores_filename,
-                                   "CinCECGtorso", "CinCECGTorso")
-            in_file_string_replace(self._baseline_scores_filename,
-                                   "StarlightCurves", "StarLightCurves")
+            self._refresh_index_file(url_multivariate,
+                                     self._list_multivariate_filename,
+                                     force_refresh)
+            self._refresh_index_file(url_baseline,
+                                     self._baseline_scores_filename,
+                                     force_refresh, fix_typos=True)
         except Exception:
-            self._baseline_scores_filename = None
+            # keep a stale cached copy if one exists (offline use),
+            # otherwise mark baseline scores as unavailable as before
+            if not os.path.exists(self._baseline_scores_filename):
+                self._baseline_scores_filename = None
 
-        self._ignore_list = ["Data Descriptions"]
+        self._ignore_list = ["Data Descriptions", ".zips"]
         # File names for datasets for which it is not obvious
         # key: from timeseriesclassification.com, value: right dataset name
         self._filenames = {
@@ -82,6 +97,94 @@ class UCR_UEA_datasets:
             "StarlightCurves": "StarLightCurves"
         }
 
+    # Parsed summary CSV files, shared across instances and keyed by
+    # (path, mtime) so that a refreshed file invalidates its cache entry
+    _parsed_csv_cache = {}
+
+    @classmethod
+    def _parse_index_csv(cls, filename, name_column):
+        """Parse one of the summary CSV files from the UCR/UEA website.
+
+        Rows are read with :class:`csv.reader` and positional lookups
+        rather than ``DictReader``, which avoids building one dict per row.
+        The parsed content is cached at the class level, keyed by file path
+        and modification time, so repeated calls (possibly from several
+        instances) parse each file version at most once.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the CSV file to be parsed.
+        name_column : str
+            Header of the column holding dataset names.
+
+        Returns
+        -------
+        list of str
+            Dataset names, in file order.
+        dict
+            Mapping from dataset name to a dict of the float-valued cells
+            of its row, keyed by column header. Cells that do not parse as
+            floats (missing scores, textual metadata) are skipped.
+        """
+        key = (filename, os.path.getmtime(filename))
+        cached = cls._parsed_csv_cache.get(key)
+        if cached is not None:
+            return cached
+        names = []
+        table = {}
+        with open(filename, "r") as f:
+            reader = csv.reader(f, delimiter=",")
+            header = next(reader)
+            name_idx = header.index(name_column)
+            value_cols = [(i, h) for i, h in enumerate(header)
+                          if i != name_idx and h]
+            for row in reader:
+                dataset_name = row[name_idx]
+                names.append(dataset_name)
+                scores = {}
+                for i, h in value_cols:
+                    try:
+                        scores[h] = float(row[i])
+                    except (ValueError, IndexError):
+                        pass
+                table[dataset_name] = scores
+        cls._parsed_csv_cache[key] = (names, table)
+        return names, table
+
+    def _refresh_index_file(self, url, local_fname, force_refresh,
+                            fix_typos=False):
+        """Download one of the summary CSV files from the UCR/UEA website,
+        unless a fresh enough cached copy is available.
+
+        Parameters
+        ----------
+        url : str
+            URL the CSV file should be fetched from.
+        local_fname : str
+            Path of the cached copy.
+        force_refresh : bool
+            Whether to download the file even if a fresh cached copy
+            exists.
+        fix_typos : bool (default: False)
+            Whether known dataset name typos should be fixed in the
+            downloaded file. Since cached copies have already been fixed,
+            this only needs to happen right after a download.
+        """
+        if (not force_refresh and self.use_cache and
+                os.path.exists(local_fname) and
+                time.time() - os.path.getmtime(local_fname) <
+                _INDEX_FILES_TTL):
+            return
+        urlretrieve(url, local_fname)
+        if fix_typos:
+            # fix typos in that CSV to match with the name in the
+            # download link
+            in_file_string_replace(local_fname,
+                                   "CinCECGtorso", "CinCECGTorso")
+            in_file_string_replace(local_fname,
+                                   "StarlightCurves", "StarLightCurves")
+
     def baseline_accuracy(self, list_datasets=None, list_methods=None):
         """Report baseline performances as provided by UEA/UCR website (for
         univariate datasets only).
@@ -118,19 +221,17 @@ class UCR_UEA_datasets:
         >>> len(all_dict_acc)
         85
         """
-        with open(self._baseline_scores_filename, "r") as f:
-            d_out = dict()
-            for perfs_dict in csv.DictReader(f, delimiter=","):
-                dataset_name = perfs_dict[""]
-                if list_datasets is None or dataset_name in list_datasets:
-                    d_out[dataset_name] = {}
-                    for m in perfs_dict.keys():
-                        if m != "" and (list_methods is None or m in list_methods):
-                            try:
-                                d_out[dataset_name][m] = float(perfs_dict[m])
-                            except ValueError:  # Missing score case (score == "")
-                                pass
-            return d_out
+        _, perfs = self._parse_index_csv(self._baseline_scores_filename,
+                                         name_column="")
+        return {
+            dataset_name: {
+                m: score
+                for m, score in scores.items()
+                if list_methods is None or m in list_methods
+            }
+            for dataset_name, scores in perfs.items()
+            if list_datasets is None or dataset_name in list_datasets
+        }
 
     def list_univariate_datasets(self):
         """List univariate datasets in the UCR/UEA archive.
@@ -146,11 +247,9 @@ class UCR_UEA_datasets:
         list of str:
             A list of the names of all univariate datasets.
         """
-        with open(self._baseline_scores_filename, "r") as f:
-            return [
-                perfs_dict[""]  # get the dataset name
-                for perfs_dict in csv.DictReader(f, delimiter=",")
-            ]
+        names, _ = self._parse_index_csv(self._baseline_scores_filename,
+                                         name_column="")
+        return list(names)
 
     def list_multivariate_datasets(self):
         """List multivariate datasets in the UCR/UEA archive.
@@ -166,11 +265,9 @@ class UCR_UEA_datasets:
         list of str:
             A list of the names of all multivariate dataset namas.
         """
-        with open(self._list_multivariate_filename, "r") as f:
-            return [
-                infos_dict["Problem"]  # get the dataset name
-                for infos_dict in csv.DictReader(f, delimiter=",")
-            ]
+        names, _ = self._parse_index_csv(self._list_multivariate_filename,
+                                         name_column="Problem")
+        return list(names)
 
     def list_datasets(self):
         """List datasets (both univariate and multivariate) available in the 
@@ -338,14 +435,26 @@ class UCR_UEA_datasets:
             return (os.path.exists(basename + "_TRAIN.%s" % ext) and
                     os.path.exists(basename + "_TEST.%s" % ext))
 
-    def cache_all(self):
-        """Cache all datasets from the UCR/UEA archive for later use."""
-        for dataset_name in self.list_datasets():
-            try:
-                self.load_dataset(dataset_name)
-            except Exception as exception:
-                warnings.warn("Could not cache dataset \"%s\": %s"
-                              % (dataset_name, str(exception)),
-                              category=RuntimeWarning, stacklevel=2)
+    def cache_all(self, max_workers=8):
+        """Cache all datasets from the UCR/UEA archive for later use.
+
+        Parameters
+        ----------
+        max_workers : int (default: 8)
+            Number of datasets to be downloaded and extracted concurrently.
+            Downloads are I/O-bound, so caching the whole archive benefits
+            from a moderate number of parallel workers.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.load_dataset, dataset_name): dataset_name
+                for dataset_name in self.list_datasets()
+            }
+            for future in as_completed(futures):
+                exception = future.exception()
+                if exception is not None:
+                    warnings.warn("Could not cache dataset \"%s\": %s"
+                                  % (futures[future], str(exception)),
+                                  category=RuntimeWarning, stacklevel=2)
 
 
@@ -1,11 +1,10 @@
 import numpy as np
-from numpy.lib.stride_tricks import as_strided
-from scipy.spatial.distance import pdist, squareform
+from numba import njit, prange
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.base import TransformerMixin
 from sklearn.utils.validation import check_array, check_is_fitted
 
 from tslearn.bases import BaseModelPackage, TimeSeriesBaseEstimator
-from tslearn.preprocessing import TimeSeriesScalerMeanVariance
 from tslearn.utils import check_dims
 
 stumpy_msg = ('stumpy is not installed, stumpy features will not be'
@@ -51,21 +50,163 @@ def _series_to_segments(time_series, segment_size):
            [3., 4.],
            [4., 5.]])
     """
+    segments = sliding_window_view(time_series, segment_size, axis=-2)
+    # sliding_window_view appends the window axis last; move it back so
+    # that segments are indexed as (..., segment, time, feature)
+    segments = np.moveaxis(segments, -1, -2)
     if time_series.ndim == 3:
-        l_segments = [_series_to_segments(ts, segment_size)
-                      for ts in time_series]
-        return np.vstack(l_segments)
-    elem_size = time_series.strides[0]
-    segments = as_strided(
-        time_series,
-        strides=(elem_size, elem_size, time_series.strides[1]),
-        shape=(time_series.shape[0] - segment_size + 1,
-               segment_size, time_series.shape[1]),
-        writeable=False
-    )
+        # stack the segments of all series; this reshape is the single
+        # materializing copy of the whole function
+        return segments.reshape((-1, ) + segments.shape[2:])
     return segments
 
 
+def _rolling_stats(time_series, segment_size):
+    """Compute mean, variance and sum of squares of every sliding window of
+    length segment_size in a single pass over the series, using cumulated
+    sums for O(1) work per window.
+
+    Windows slide along the last axis, so a whole dataset of series can be
+    processed in one call.
+
+    Examples
+    --------
+    >>> time_series = np.array([1., 2., 3., 4.])
+    >>> mean, var, sum2 = _rolling_stats(time_series, segment_size=2)
+    >>> mean
+    array([1.5, 2.5, 3.5])
+    >>> var
+    array([0.25, 0.25, 0.25])
+    >>> sum2
+    array([ 5., 13., 25.])
+    >>> mean, var, sum2 = _rolling_stats(np.array([[1., 2.], [3., 5.]]),
+    ...                                  segment_size=2)
+    >>> mean
+    array([[1.5],
+           [4. ]])
+    """
+    m = segment_size
+    zeros = np.zeros(time_series.shape[:-1] + (1, ),
+                     dtype=time_series.dtype)
+    cumsum = np.concatenate(
+        (zeros, np.cumsum(time_series, axis=-1)), axis=-1)
+    cumsum2 = np.concatenate(
+        (zeros, np.cumsum(time_series ** 2, axis=-1)), axis=-1)
+    seg_sum = cumsum[..., m:] - cumsum[..., :-m]
+    seg_sum2 = cumsum2[..., m:] - cumsum2[..., :-m]
+    seg_mean = seg_sum / m
+    seg_var = seg_sum2 / m - seg_mean ** 2
+    np.maximum(seg_var, 0., out=seg_var)
+    return seg_mean, seg_var, seg_sum2
+
+
+@njit(parallel=True, cache=True)
+def _matrix_profile_numba(X2d, m, band_width, scale):
+    """Compute matrix profiles for a stack of univariate time series.
+
+    `X2d` is expected to be a contiguous `(n_ts, sz)` float array. Series
+    are processed in parallel; within a series, sliding dot products are
+    maintained along diagonals with O(1) updates so that no pairwise
+    distance matrix is ever materialized.
+    """
+    n_ts, sz = X2d.shape
+    n_segments = sz - m + 1
+    profiles = np.empty((n_ts, n_segments))
+    for i_ts in prange(n_ts):
+        time_series = X2d[i_ts]
+
+        # Rolling sums for O(1) per-window mean and variance
+        seg_sum = np.empty(n_segments)
+        seg_sum2 = np.empty(n_segments)
+        acc = 0.
+        acc2 = 0.
+        for t in range(m):
+            acc += time_series[t]
+            acc2 += time_series[t] ** 2
+        seg_sum[0] = acc
+        seg_sum2[0] = acc2
+        for i in range(1, n_segments):
+            acc += time_series[i + m - 1] - time_series[i - 1]
+            acc2 += time_series[i + m - 1] ** 2 - time_series[i - 1] ** 2
+            seg_sum[i] = acc
+            seg_sum2[i] = acc2
+
+        seg_mean = seg_sum / m
+        seg_std = np.empty(n_segments)
+        sq_norm = np.empty(n_segments)
+        seg_nan = np.zeros(n_segments, dtype=np.bool_)
+        for i in range(n_segments):
+            # The rolling variance of a constant segment can drift
+            # slightly positive through cancellation, so constancy is
+            # decided from the exact range of the segment rather than
+            # from the variance alone. Segments reaching into the NaN
+            # padding of variable-length series are flagged on the way:
+            # NaN compares False with everything, so they would
+            # otherwise be mistaken for constant segments.
+            lo = time_series[i]
+            hi = time_series[i]
+            has_nan = lo != lo
+            for t in range(1, m):
+                v = time_series[i + t]
+                if v != v:
+                    has_nan = True
+                elif v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            seg_nan[i] = has_nan
+            var_i = seg_sum2[i] / m - seg_mean[i] ** 2
+            if hi > lo and var_i > 0.:
+                seg_std[i] = np.sqrt(var_i)
+                sq_norm[i] = m
+            else:
+                # constant segment: z-normalization maps it to zero
+                seg_std[i] = 1.
+                sq_norm[i] = 0.
+
+        row_min = np.full(n_segments, np.inf)
+        for offset in range(band_width + 1, n_segments):
+            qt = 0.
+            for t in range(m):
+                qt += time_series[t] * time_series[offset + t]
+            for i in range(n_segments - offset):
+                j = i + offset
+                if i > 0:
+                    qt += (time_series[i + m - 1] * time_series[j + m - 1] -
+                           time_series[i - 1] * time_series[j - 1])
+                if seg_nan[i] or seg_nan[j]:
+                    dist2 = np.nan
+                elif scale:
+                    if sq_norm[i] == 0. or sq_norm[j] == 0.:
+                        # a z-normalized constant segment is the zero
+                        # vector, so the cross term vanishes exactly
+                        dist2 = sq_norm[i] + sq_norm[j]
+                    else:
+                        dist2 = (sq_norm[i] + sq_norm[j] -
+                                 2. * (qt - m * seg_mean[i] * seg_mean[j]) /
+                                 (seg_std[i] * seg_std[j]))
+                else:
+                    dist2 = seg_sum2[i] + seg_sum2[j] - 2. * qt
+                if dist2 != dist2:
+                    # distances involving NaN-padded segments are
+                    # undefined and propagate to both rows, as in the
+                    # numpy path
+                    row_min[i] = np.nan
+                    row_min[j] = np.nan
+                else:
+                    if dist2 < 0.:
+                        dist2 = 0.
+                    if dist2 < row_min[i]:
+                        row_min[i] = dist2
+                    if dist2 < row_min[j]:
+                        row_min[j] = dist2
+        for i in range(n_segments):
+            if seg_nan[i]:
+                row_min[i] = np.nan
+            profiles[i_ts, i] = np.sqrt(row_min[i])
+    return profiles
+
+
 class MatrixProfile(TransformerMixin,
                     BaseModelPackage,
                     TimeSeriesBaseEstimator):
@@ -82,7 +223,12 @@ class MatrixProfile(TransformerMixin,
     implementation : str (default: "numpy")
         Matrix profile implementation to use.
         Defaults to "numpy" to use the pure numpy version.
-        All the available implementations are ["numpy", "stump", "gpu_stump"].
+        All the available implementations are ["numpy", "numba", "stump",
+        "gpu_stump"].
+
+        "numba" uses a numba-compiled kernel that processes series in
+        parallel and keeps a constant memory footprint per series, which
+        makes it the fastest option for datasets of many (or long) series.
 
         "stump" and "gpu_stump" are both implementations from the stumpy
         python library, the latter requiring a GPU.
@@ -98,6 +244,22 @@ class MatrixProfile(TransformerMixin,
          Default for this parameter is set to `True` to match the standard
          matrix profile setup.
 
+    dtype : numpy dtype or None (default: None)
+        Floating-point precision to be used internally by the "numpy" and
+        "numba" implementations. If None, computations are performed in the
+        dtype of the validated input (float64). Passing `numpy.float32`
+        halves the memory footprint and roughly doubles BLAS throughput at
+        the cost of some precision. The transformed output is always
+        returned as float64.
+
+    Notes
+    -----
+        Only univariate time series (`d == 1`) are supported. The "numpy"
+        and "numba" implementations take advantage of this restriction to
+        operate on contiguous 2D `(n_ts, sz)` arrays throughout, which is
+        what lets segment extraction stay copy-free and the distance
+        computation run as batched BLAS / compiled kernels.
+
     Examples
     --------
     >>> time_series = [0., 1., 3., 2., 9., 1., 14., 15., 1., 2., 2., 10., 7.]
@@ -119,11 +281,13 @@ class MatrixProfile(TransformerMixin,
     """
 
     def __init__(
-        self, subsequence_length=1, implementation="numpy", scale=True
+        self, subsequence_length=1, implementation="numpy", scale=True,
+        dtype=None
     ):
         self.subsequence_length = subsequence_length
         self.scale = scale
         self.implementation = implementation
+        self.dtype = dtype
 
     def _is_fitted(self):
         check_is_fitted(self, '_X_fit_dims')
@@ -154,9 +318,10 @@ class MatrixProfile(TransformerMixin,
         n_ts, sz, d = X.shape
 
         if d > 1:
-            raise NotImplementedError("We currently don't support using "
-                                      "multi-dimensional matrix profiles "
-                                      "from the stumpy library.")
+            raise NotImplementedError("We currently don't support "
+                                      "multi-dimensional matrix profiles: "
+                                      "all implementations are specialized "
+                                      "for univariate time series.")
 
         output_size = sz - self.subsequence_length + 1
         X_transformed = np.empty((n_ts, output_size, 1))
@@ -169,7 +334,7 @@ class MatrixProfile(TransformerMixin,
                 result = stumpy.stump(
                     T_A=X[i_ts, :, 0].ravel(),
                     m=self.subsequence_length)
-                X_transformed[i_ts, :, 0] = result[:, 0].astype(np.float)
+                X_transformed[i_ts, :, 0] = result[:, 0].astype(float)
 
         elif self.implementation == "gpu_stump":
             if not STUMPY_INSTALLED:
@@ -179,27 +344,93 @@ class MatrixProfile(TransformerMixin,
                 result = stumpy.gpu_stump(
                     T_A=X[i_ts, :, 0].ravel(),
                     m=self.subsequence_length)
-                X_transformed[i_ts, :, 0] = result[:, 0].astype(np.float)
+                X_transformed[i_ts, :, 0] = result[:, 0].astype(float)
+
+        elif self.implementation == "numba":
+            band_width = int(np.ceil(self.subsequence_length / 4))
+            X_transformed[:, :, 0] = _matrix_profile_numba(
+                np.ascontiguousarray(X[:, :, 0], dtype=self.dtype),
+                self.subsequence_length,
+                band_width,
+                self.scale
+            )
 
         elif self.implementation == "numpy":
-            scaler = TimeSeriesScalerMeanVariance()
             band_width = int(np.ceil(self.subsequence_length / 4))
-            for i_ts in range(n_ts):
-                segments = _series_to_segments(X[i_ts], self.subsequence_length)
+            m = self.subsequence_length
+            if self.dtype is not None:
+                X = X.astype(self.dtype)
+            n_segments = output_size
+            series_2d = X[:, :, 0]
+
+            seg_mean, seg_var, seg_sum2 = _rolling_stats(series_2d, m)
+            if self.scale:
+                seg_std = np.sqrt(seg_var)
+                # The cumsum-based variance of a constant window suffers
+                # from cancellation and can come out slightly positive,
+                # in which case the z-normalized distance would divide by
+                # a spurious tiny standard deviation. Constant windows
+                # are therefore detected exactly, from their range.
+                windows = sliding_window_view(series_2d, m, axis=1)
+                non_constant = ((windows.max(axis=-1) >
+                                 windows.min(axis=-1)) &
+                                (seg_std > 0.))
+                seg_std_safe = np.where(non_constant, seg_std, 1.)
+                sq_norms = np.where(non_constant, float(m), 0.)
+
+            # STOMP: dot products of the first segment against every
+            # other one come from a single FFT-based correlation per
+            # series, then each subsequent row of the (virtual) dot
+            # product matrix is derived from the previous one with one
+            # multiply-add per entry. Only the current row is ever held
+            # in memory, so the footprint stays O(n_ts * n) instead of
+            # the O(n_ts * n^2) of a materialized distance tensor.
+            fft_series = np.fft.rfft(series_2d, n=sz, axis=1)
+            fft_first_seg = np.fft.rfft(series_2d[:, :m], n=sz, axis=1)
+            QT = np.fft.irfft(fft_series * np.conj(fft_first_seg),
+                              n=sz, axis=1)[:, :n_segments]
+            first_row = QT.copy()
+
+            row_min = np.empty((n_ts, n_segments), dtype=X.dtype)
+            for i in range(n_segments):
+                if i > 0:
+                    # QT[b, j] <- <seg_i, seg_j> from <seg_{i-1}, seg_{j-1}>
+                    QT[:, 1:] = (QT[:, :-1] -
+                                 series_2d[:, i - 1:i] *
+                                 series_2d[:, :n_segments - 1] +
+                                 series_2d[:, i + m - 1:i + m] *
+                                 series_2d[:, m:m + n_segments - 1])
+                    # <seg_i, seg_0> by symmetry of the dot products
+                    QT[:, 0] = first_row[:, i]
+
                 if self.scale:
-                    segments = scaler.fit_transform(segments)
-                n_segments = segments.shape[0]
-                segments_2d = segments.reshape((-1, self.subsequence_length * d))
-                dists = squareform(pdist(segments_2d, "euclidean"))
-                band = (np.tri(n_segments, n_segments,
-                            band_width, dtype=np.bool) &
-                        ~np.tri(n_segments, n_segments,
-                                -(band_width + 1), dtype=np.bool))
-                dists[band] = np.inf
-                X_transformed[i_ts] = dists.min(axis=1, keepdims=True)
+                    # z-normalized distance, derived from the dot
+                    # products: <seg_i - mu_i, seg_j - mu_j> =
+                    # QT[b, j] - m mu_i mu_j, and each z-normalized
+                    # segment has squared norm m (0 for constant
+                    # segments, scaled by convention with a unit
+                    # standard deviation). A z-normalized constant
+                    # segment is the zero vector, so the cross term is
+                    # masked out (rather than left to round-off) when
+                    # either segment is constant.
+                    dists = (sq_norms[:, i:i + 1] + sq_norms -
+                             2. * non_constant[:, i:i + 1] * non_constant *
+                             (QT -
+                              m * seg_mean[:, i:i + 1] * seg_mean) /
+                             (seg_std_safe[:, i:i + 1] * seg_std_safe))
+                else:
+                    dists = seg_sum2[:, i:i + 1] + seg_sum2 - 2. * QT
+
+                # Exclusion zone |i - j| <= band_width
+                dists[:, max(0, i - band_width):i + band_width + 1] = np.inf
+                np.maximum(dists, 0., out=dists)
+                row_min[:, i] = dists.min(axis=1)
+
+            X_transformed[:, :, 0] = np.sqrt(row_min)
 
         else:
-            available_implementations = ["numpy", "stump", "gpu_stump"]
+            available_implementations = ["numpy", "numba", "stump",
+                                         "gpu_stump"]
             raise ValueError(
                 'This "{}" matrix profile implementation is not'
                 ' recognized. Available implementations are {}.'
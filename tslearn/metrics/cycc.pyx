@@ -8,7 +8,7 @@ from cpython cimport bool
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
 
-DTYPE = numpy.float
+DTYPE = float
 ctypedef numpy.float_t DTYPE_t
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
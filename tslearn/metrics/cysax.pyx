@@ -8,8 +8,8 @@ cimport cython
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
 
-DTYPE = numpy.float
-DTYPE_INT = numpy.int
+DTYPE = float
+DTYPE_INT = int
 ctypedef numpy.float_t DTYPE_t
 ctypedef numpy.int_t DTYPE_INT_t
 
@@ -4,6 +4,78 @@ import pytest
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
 
 
+def test_numba_consistent_with_numpy():
+    from tslearn.matrix_profile import MatrixProfile
+
+    rng = np.random.RandomState(0)
+    X = rng.randn(3, 30, 1)
+
+    for scale in [True, False]:
+        mp = MatrixProfile(subsequence_length=8, scale=scale)
+        mp_numba = MatrixProfile(subsequence_length=8, scale=scale,
+                                 implementation="numba")
+        np.testing.assert_allclose(mp.fit_transform(X),
+                                   mp_numba.fit_transform(X),
+                                   atol=1e-8)
+
+    # variable-length (NaN-padded) series: NaNs must propagate
+    # identically in both implementations
+    X[1, 24:] = np.nan
+    X_tr = MatrixProfile(subsequence_length=8).fit_transform(X)
+    X_tr_numba = MatrixProfile(
+        subsequence_length=8, implementation="numba").fit_transform(X)
+    assert np.isnan(X_tr_numba[1]).all()
+    assert np.isfinite(X_tr_numba[0]).all()
+    np.testing.assert_allclose(X_tr, X_tr_numba, atol=1e-8)
+
+
+def test_constant_windows():
+    # A flat plateau in an otherwise varying series produces constant
+    # windows whose rolling variance only differs from zero by
+    # cancellation noise; they must not be scaled by that spurious
+    # standard deviation
+    from tslearn.matrix_profile import MatrixProfile
+
+    rng = np.random.RandomState(0)
+    ts = np.cumsum(rng.randn(200))
+    ts[80:120] = ts[80]
+    X = ts.reshape((1, -1, 1))
+    m = 16
+
+    # brute-force reference, z-normalizing each segment explicitly
+    segments = np.array([ts[i:i + m] for i in range(len(ts) - m + 1)])
+    std = segments.std(axis=1, keepdims=True)
+    std[std == 0.] = 1.
+    segments = (segments - segments.mean(axis=1, keepdims=True)) / std
+    dists = np.sqrt(
+        ((segments[:, None, :] - segments[None, :, :]) ** 2).sum(axis=-1))
+    for offset in range(int(np.ceil(m / 4)) + 1):
+        np.fill_diagonal(dists[offset:], np.inf)
+        np.fill_diagonal(dists[:, offset:], np.inf)
+    expected = dists.min(axis=1)
+
+    for implementation in ["numpy", "numba"]:
+        mp = MatrixProfile(subsequence_length=m,
+                           implementation=implementation)
+        np.testing.assert_allclose(mp.fit_transform(X)[0, :, 0], expected,
+                                   atol=1e-8)
+
+
+def test_float32_dtype():
+    from tslearn.matrix_profile import MatrixProfile
+
+    rng = np.random.RandomState(0)
+    X = rng.randn(2, 40, 1)
+
+    ref = MatrixProfile(subsequence_length=8).fit_transform(X)
+    for implementation in ["numpy", "numba"]:
+        X_tr = MatrixProfile(subsequence_length=8,
+                             implementation=implementation,
+                             dtype=np.float32).fit_transform(X)
+        assert X_tr.dtype == np.float64
+        np.testing.assert_allclose(X_tr, ref, atol=1e-3)
+
+
 def test_consistent_with_stumpy():
     pytest.importorskip('stumpy')
     import stumpy
@@ -18,7 +90,7 @@ def test_consistent_with_stumpy():
 
     X_tr = mp.fit_transform(X)
     X_tr_stumpy_wrap = mp_stumpy.fit_transform(X)
-    X_tr_stumpy = stumpy.stump(X_stumpy, m=10)[:, 0].astype(np.float)
+    X_tr_stumpy = stumpy.stump(X_stumpy, m=10)[:, 0].astype(float)
 
     np.testing.assert_allclose(X_tr.ravel(), X_tr_stumpy)
     np.testing.assert_allclose(X_tr, X_tr_stumpy_wrap)
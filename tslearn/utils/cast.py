@@ -12,7 +12,7 @@ except:
 from .utils import check_dataset, ts_size, to_time_series_dataset
 
 
-def to_sklearn_dataset(dataset, dtype=numpy.float, return_dim=False):
+def to_sklearn_dataset(dataset, dtype=float, return_dim=False):
     """Transforms a time series dataset so that it fits the format used in
     ``sklearn`` estimators.
 
@@ -20,7 +20,7 @@ def to_sklearn_dataset(dataset, dtype=numpy.float, return_dim=False):
     ----------
     dataset : array-like
         The dataset of time series to be transformed.
-    dtype : data type (default: numpy.float)
+    dtype : data type (default: float)
         Data type for the returned dataset.
     return_dim : boolean  (optional, default: False)
         Whether the dimensionality (third dimension should be returned together